@@ -1,18 +1,43 @@
+import functools
+import hashlib
+import io
 import json
+import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
 import os
 
 import requests
 import yaml
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, fall back to requests' stdlib json
+    orjson = None
 
 URL = "https://comiccaster.xyz/comics_list.json"
 URL_POLITICAL = "https://comiccaster.xyz/political_comics_list.json"
+FEED_URL_PREFIX = "https://comiccaster.xyz/rss/"
+
+SEP = "=" * 60
+
+# Shared keep-alive connection pool for every HTTP call this script makes
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# Seconds a downloaded comic list stays fresh, override with COMICS_CACHE_TTL (0 disables the cache)
+DEFAULT_CACHE_TTL = 24 * 60 * 60
 
 OTHER_LANGUAGES_KEYSWORDS: list[str] = [
     "en español",
@@ -20,119 +45,319 @@ OTHER_LANGUAGES_KEYSWORDS: list[str] = [
     "spanish"
 ]
 
-INVALID_SLUGS = {
+# One case-insensitive C-level scan instead of lowering and testing each keyword per field
+OTHER_LANGUAGES_RE = re.compile("|".join(map(re.escape, OTHER_LANGUAGES_KEYSWORDS)), re.IGNORECASE)
+
+INVALID_SLUGS = frozenset({
     "about", "login", "terms", "privacy-policy",
     "submit-your-comics", "blog", "comics",
     "genre", "creator"
-}
+})
 
+MULTI_SELECT_HELP_TEXT = 'Use ⌘+click (Mac) or ctrl+click (Windows) to select multiple items. Use Shift+click to select a whole range at once.'
 
-def load_environment():
-    """Load environment variables from plugins.env file"""
-    current_dir = Path.cwd()
+# Use the libyaml C loader/dumper when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-    # If we're in the scripts directory, look for plugins.env in the parent directory
-    if current_dir.name == 'scripts':
-        env_path = current_dir.parent / "plugins.env"
-    else:
-        # We're already in the repository root
-        env_path = current_dir / "plugins.env"
 
-    if env_path.exists():
-        load_dotenv(env_path)
-        print(f"Loaded environment from: {env_path}")
+class OrderedDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    """Safe dumper that keeps dict insertion order."""
+
+
+def represent_dict_order(dumper, data):
+    return dumper.represent_mapping('tag:yaml.org,2002:map', data.items())
+
+
+OrderedDumper.add_representer(dict, represent_dict_order)
+
+YAML_DUMP_OPTIONS = dict(Dumper=OrderedDumper, default_flow_style=False, allow_unicode=True,
+                         sort_keys=False, width=1000)
+
+# The top-level custom_fields key, and the next top-level key that ends its block.
+# Multi-line scalars are dumped with unindented blank lines, so the block end can't
+# be found by whitelisting continuation lines; every other line of a dumped value is
+# indented, so an unindented plain `key:` can only be the next top-level key.
+CUSTOM_FIELDS_KEY_RE = re.compile(r'^custom_fields:.*(?:\n|\Z)', re.MULTILINE)
+TOP_LEVEL_KEY_RE = re.compile(r'^[A-Za-z_][\w-]*:(?: |$)', re.MULTILINE)
+
+
+# All paths are resolved once from this file's location, whatever the working directory
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_ROOT / "data"
+ENV_PATH = REPO_ROOT / "plugins.env"
+CONFIG_PATH = DATA_DIR / "comic_config.json"
+HTTP_CACHE_DIR = DATA_DIR / ".http_cache"
+FAILED_FEEDS_PATH = DATA_DIR / "failed_feeds_report.yml"
+SETTINGS_PATH = REPO_ROOT / "plugin" / "settings.yml"
+OVERVIEW_HASH_PATH = DATA_DIR / ".overview.hash"
+INDEX_PATH = REPO_ROOT / "index.html"
+ATOM_PATH = DATA_DIR / "demo_data.atom"
+# Renderers whose source is part of the overview digest, so template edits re-render
+RENDERER_PATHS = (REPO_ROOT / "scripts" / "generate_comic_overview.py",
+                  REPO_ROOT / "scripts" / "generate_rss_aggregator.py")
+# Arguments for generate_atom_feed, also part of the overview digest
+ATOM_FEED_OPTIONS = dict(
+    comics_per_entry=4,
+    entries=12,
+    mode="recent",  # or "random" for random selection
+)
+
+
+class ComicRecord(NamedTuple):
+    """A comic from the comiccaster lists, normalised once after fetching"""
+    name: str
+    slug: Optional[str]
+    author: Optional[str]
+    name_lower: str
+    feed_url: Optional[str]
+
+
+def to_comic_records(comics: list) -> List[ComicRecord]:
+    """Convert the raw JSON dicts into ComicRecords"""
+    records = []
+    for comic in comics:
+        name = comic.get("name", "Unknown")
+        slug = comic.get("slug")
+        records.append(ComicRecord(name, slug, comic.get("author", ""), (name or "").lower(), get_feed_url(slug)))
+    return records
+
+
+def load_environment():
+    """Load environment variables from plugins.env file"""
+    if ENV_PATH.exists():
+        load_dotenv(ENV_PATH)
+        print(f"Loaded environment from: {ENV_PATH}")
     else:
-        print(f"plugins.env not found at {env_path}, using system environment variables")
+        print(f"plugins.env not found at {ENV_PATH}, using system environment variables")
 
 
 def get_plugin_config():
     """Load plugin config from data/comic_parser_data.json"""
-    data_dir = get_data_dir()
-    config_path = data_dir / "comic_config.json"
-
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        excluded = config.get('excluded_feeds', [])
+    if CONFIG_PATH.exists():
+        config = loads_json(CONFIG_PATH.read_bytes())
+        excluded = frozenset(config.get('excluded_feeds', []))
         categories = config.get('feed_categories', {})
         extra_feeds = config.get('extra_feeds', [])
-        print(f"Loaded plugin config from {config_path} "
+        print(f"Loaded plugin config from {CONFIG_PATH} "
               f"({len(excluded)} exclusions, {len(categories)} category overrides)")
         return excluded, categories, extra_feeds
     else:
-        print(f"No plugin config found at {config_path}")
-        return [], {}, []
+        print(f"No plugin config found at {CONFIG_PATH}")
+        return frozenset(), {}, []
 
 
 def is_other_language(slug: str, name: str, author: str, feed_categories: dict):
     # Explicit category override takes precedence
-    if feed_categories.get(slug) == "other_languages":
-        return True
-    if feed_categories.get(slug) is not None:
-        return False  # explicitly categorised as something else
+    category = feed_categories.get(slug)
+    if category is not None:
+        return category == "other_languages"  # False if explicitly categorised as something else
+
+    return has_other_language_keyword(slug, name, author)
+
+
+@functools.lru_cache(maxsize=None)
+def has_other_language_keyword(slug: str, name: str, author: str) -> bool:
+    """Keyword check behind is_other_language, memoized as it only depends on the strings"""
+    search = OTHER_LANGUAGES_RE.search
+    return bool(name and (search(name) or search(slug) or (author and search(author))))
 
-    if name:
-        lower_name = name.lower()
-        slug_lower = slug.lower()
-        author_lower = author.lower() if author else ""
 
-        for keyword in OTHER_LANGUAGES_KEYSWORDS:
-            if keyword in lower_name or keyword in slug_lower or keyword in author_lower:
-                return True
-    return False
+def loads_json(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps_json(data) -> bytes:
+    """UTF-8 JSON indented by 2 spaces, byte-identical with or without orjson"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def overview_digest(overview_data: list) -> str:
+    """Stable hash of the overview data (independent of dict key order), the renderers' source
+    and the Atom feed options"""
+    if orjson:
+        data = orjson.dumps(overview_data, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(overview_data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    digest = hashlib.blake2b(data)
+    for path in RENDERER_PATHS:
+        digest.update(path.read_bytes())
+    digest.update(json.dumps(ATOM_FEED_OPTIONS, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def read_cached_json(path: Path):
+    """Decode a cached JSON file, or None if it is missing, truncated or corrupt"""
+    try:
+        return loads_json(path.read_bytes())
+    except (OSError, ValueError):
+        return None
 
 
 def get_comics_data(url: str):
+    """Fetch a comic list JSON, served from data/.http_cache while it is fresh.
+
+    Once the TTL has expired the cached copy is revalidated with
+    If-None-Match / If-Modified-Since, so an unchanged list costs a 304.
+    An unreadable cached copy is treated as a miss and fetched again.
+    """
+    ttl = int(os.environ.get("COMICS_CACHE_TTL", DEFAULT_CACHE_TTL))
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.json"
+    meta_path = HTTP_CACHE_DIR / f"{key}.meta.json"
+
+    headers = {}
+    if ttl > 0 and body_path.exists():
+        if time.time() - body_path.stat().st_mtime < ttl:
+            data = read_cached_json(body_path)
+            if data is not None:
+                print("Using cached:", url)
+                return data
+            print("Discarding unreadable cache:", url)
+        else:
+            meta = read_cached_json(meta_path) or {}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
     print("Fetching:", url)
-    r = requests.get(url)
+    r = SESSION.get(url, headers=headers, timeout=15)
+    if r.status_code == 304:
+        data = read_cached_json(body_path)
+        if data is not None:
+            print("Not modified:", url)
+            body_path.touch()
+            return data
+        print("Discarding unreadable cache:", url)
+        r = SESSION.get(url, timeout=15)
     r.raise_for_status()
-    return r.json()
+    data = loads_json(r.content)
 
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_atomic(body_path, r.content)
+    write_atomic(meta_path, json.dumps({
+        'etag': r.headers.get('ETag'),
+        'last_modified': r.headers.get('Last-Modified'),
+    }))
+    return data
 
 
-def get_data_dir():
-    """Get the data directory path"""
-    current_dir = Path.cwd()
-    if current_dir.name == 'scripts':
-        return current_dir.parent / "data"
-    else:
-        return current_dir / "data"
+def get_all_comics_data(*urls: str) -> list:
+    """Fetch several comic lists in parallel over the shared SESSION"""
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(get_comics_data, urls))
 
 
-def get_failed_feeds_path():
-    """Get the path for the failed feeds report in data/"""
-    data_dir = get_data_dir()
-    data_dir.mkdir(exist_ok=True)
-    return data_dir / "failed_feeds_report.yml"
+def print_lines(lines: list):
+    """Print collected log lines with a single write"""
+    if lines:
+        print("\n".join(lines))
+
+
+def get_feed_url(slug: str):
+    """Build the comiccaster RSS feed url for a comic slug"""
+    return FEED_URL_PREFIX + slug if slug else None
+
 
+def get_excluded_slugs(excluded_feeds: frozenset) -> frozenset:
+    """Slugs of the excluded comiccaster feeds, so exclusions can be checked before building urls"""
+    return frozenset(url[len(FEED_URL_PREFIX):] for url in excluded_feeds if url.startswith(FEED_URL_PREFIX))
 
 
-def should_exclude_feed(feed_url: str, excluded_feeds: list) -> bool:
-    """Check if a feed should be excluded based on the EXCLUSIONS list"""
-    return feed_url in excluded_feeds
+def categorize_comics(
+    comics_data: List[ComicRecord],
+    political_slugs: frozenset,
+    excluded_slugs: frozenset,
+    feed_categories: dict,
+) -> Dict[str, List[ComicRecord]]:
+    """Split the regular comic list into 'regular' and 'other_lang' candidates in one pass.
+
+    Political comics and invalid slugs are skipped, excluded feeds are logged and skipped.
+    """
+    regular, other_lang, excluded_log = [], [], []
+    # Bind the appends once instead of looking them up per comic
+    add_regular, add_other_lang = regular.append, other_lang.append
+    for comic in comics_data:
+        name, slug = comic.name, comic.slug
+        if not slug or slug in INVALID_SLUGS or slug in political_slugs:
+            continue
+
+        if slug in excluded_slugs:
+            excluded_log.append(f"  Excluded: {name} ({comic.feed_url})")
+        elif is_other_language(slug, name, comic.author, feed_categories):
+            add_other_lang(comic)
+        else:
+            add_regular(comic)
+    print_lines(excluded_log)
+    return {'regular': regular, 'other_lang': other_lang}
+
+
+def filter_valid_comics(candidates: list, valid_results: list) -> list:
+    """Keep the candidate comics whose feed passed validation"""
+    valid_names = {result.name for result in valid_results}
+    return [comic for comic in candidates if comic.name in valid_names]
+
+
+def to_select_options(*groups: list) -> list:
+    """Sort (sort_key, display_name, url) tuples from all groups in one pass and turn them into select options"""
+    entries = list(chain.from_iterable(groups))
+    entries.sort(key=itemgetter(0))
+    return [{display_name: url} for _, display_name, url in entries]
+
+
+def multi_select_field(keyname: str, name: str, options: list) -> dict:
+    """An optional multi-select settings field sharing the common help text"""
+    return {
+        'keyname': keyname,
+        'field_type': 'select',
+        'name': name,
+        'multiple': True,
+        'help_text': MULTI_SELECT_HELP_TEXT,
+        'optional': True,
+        'options': options
+    }
 
 
-def validate_feeds_via_docker(
-    feeds: Dict[str, str],
+def failed_result(name: str, url: str, error_message: str) -> SimpleNamespace:
+    """An invalid validation result for a feed the validator did not check"""
+    return SimpleNamespace(url=url, name=name, is_valid=False,
+                           error_message=error_message,
+                           comic_title=None, image_url=None,
+                           image_source=None, feed_type=None,
+                           link=None, caption=None)
+
+
+def is_valid_feed_url(url: str) -> bool:
+    """Cheap sanity check so malformed urls never reach the validator"""
+    if not url:
+        return False
+    parsed = urlparse(url)
+    return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
+
+
+def run_feed_validator(
+    feeds: List[Tuple[str, str]],
     timeout: int = 15000,
     concurrency: int = 20,
-) -> Tuple[List[SimpleNamespace], List[SimpleNamespace]]:
+) -> List[SimpleNamespace]:
     """Validate feeds by running the Node.js validator inside Docker.
 
     Args:
-        feeds: Dictionary of {name: url}
+        feeds: List of (name, url) pairs
         timeout: Per-feed timeout in milliseconds
         concurrency: Max parallel fetches inside the container
 
     Returns:
-        Tuple of (valid_results, invalid_results) as SimpleNamespace objects
-        with the same attributes as the old ValidationResult dataclass.
+        One SimpleNamespace per feed, in input order, with the same
+        attributes as the old ValidationResult dataclass.
     """
     if not feeds:
-        return [], []
+        return []
 
     payload = json.dumps({
-        "feeds": [{"name": n, "url": u} for n, u in feeds.items()],
+        "feeds": [{"name": n, "url": u} for n, u in feeds],
         "timeout": timeout,
         "concurrency": concurrency,
     })
@@ -151,21 +376,47 @@ def validate_feeds_via_docker(
     if proc.returncode != 0:
         print(f"[!] Docker validator exited with code {proc.returncode}")
         # Treat every feed as invalid
-        return [], [
-            SimpleNamespace(url=u, name=n, is_valid=False,
-                            error_message="Docker validator failed",
-                            comic_title=None, image_url=None,
-                            image_source=None, feed_type=None,
-                            link=None, caption=None)
-            for n, u in feeds.items()
-        ]
-
-    results_json = json.loads(proc.stdout)
-    valid, invalid = [], []
-    for r in results_json:
-        obj = SimpleNamespace(**r)
-        (valid if obj.is_valid else invalid).append(obj)
-    return valid, invalid
+        return [failed_result(n, u, "Docker validator failed") for n, u in feeds]
+
+    return [SimpleNamespace(**r) for r in json.loads(proc.stdout)]
+
+
+def validate_feed_groups(
+    groups: Dict[str, Dict[str, str]],
+    timeout: int = 15000,
+    concurrency: int = 32,
+) -> Dict[str, Tuple[List[SimpleNamespace], List[SimpleNamespace]]]:
+    """Validate several {name: url} groups with a single validator run.
+
+    All groups share one pool of in-flight requests, so a slow feed in one
+    category no longer delays the start of the next. Each well-formed url is
+    sent once, even if it appears under several names or groups, and
+    malformed urls are marked invalid without being fetched. Results are
+    split back into (valid_results, invalid_results) per group.
+    """
+    unique_feeds = {}  # {url: name} of the first name seen for each url
+    for feeds in groups.values():
+        for name, url in feeds.items():
+            if is_valid_feed_url(url):
+                unique_feeds.setdefault(url, name)
+
+    # The validator returns results in input order
+    pairs = [(n, u) for u, n in unique_feeds.items()]
+    results_by_url = dict(zip(unique_feeds, run_feed_validator(pairs, timeout, concurrency)))
+
+    split = {}
+    for key, feeds in groups.items():
+        valid, invalid = [], []
+        for name, url in feeds.items():
+            result = results_by_url.get(url)
+            if result is None:
+                error = "No validation result" if is_valid_feed_url(url) else "Invalid feed URL"
+                result = failed_result(name, url, error)
+            elif result.name != name:
+                result = SimpleNamespace(**{**vars(result), 'name': name})
+            (valid if result.is_valid else invalid).append(result)
+        split[key] = (valid, invalid)
+    return split
 
 
 def save_failed_feeds_report(invalid_results: list, output_path: Path):
@@ -190,21 +441,40 @@ def save_failed_feeds_report(invalid_results: list, output_path: Path):
         }
         report['failed_feeds'].append(feed_info)
 
-    with open(output_path, 'w') as f:
-        yaml.dump(report, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    output_path.parent.mkdir(exist_ok=True)
+    write_atomic(output_path, yaml.dump(report, Dumper=OrderedDumper, default_flow_style=False,
+                                        allow_unicode=True, sort_keys=False))
 
     print(f"\n⚠️  Failed feeds report saved to: {output_path}")
     print(f"   {len(invalid_results)} feed(s) need investigation")
 
 
-def get_settings_path():
-    """Get the correct path for plugin/settings.yml"""
-    current_dir = Path.cwd()
-
-    if current_dir.name == 'scripts':
-        return current_dir.parent / "plugin" / "settings.yml"
+def write_atomic(path: Path, data):
+    """Write str/bytes to a temp file next to path in one call, then swap it in with os.replace"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def write_settings(settings_path: Path, custom_fields: list):
+    """Replace only the custom_fields block of settings.yml, leaving every other line untouched"""
+    text = settings_path.read_text(encoding='utf-8')
+    match = CUSTOM_FIELDS_KEY_RE.search(text)
+    buf = io.StringIO()
+    if match:
+        next_key = TOP_LEVEL_KEY_RE.search(text, match.end())
+        end = next_key.start() if next_key else len(text)
+        buf.write(text[:match.start()])
+        yaml.dump({'custom_fields': custom_fields}, buf, **YAML_DUMP_OPTIONS)
+        buf.write(text[end:])
     else:
-        return current_dir / "plugin" / "settings.yml"
+        # Unexpected layout, fall back to a full parse and dump
+        settings = yaml.load(text, Loader=YamlLoader)
+        settings['custom_fields'] = custom_fields
+        yaml.dump(settings, buf, **YAML_DUMP_OPTIONS)
+    write_atomic(settings_path, buf.getvalue())
 
 
 def create_updated_settings():
@@ -213,146 +483,112 @@ def create_updated_settings():
 
     # Get plugin config (excluded feeds + category overrides)
     excluded_feeds, feed_categories, extra_feeds = get_plugin_config()
+    excluded_slugs = get_excluded_slugs(excluded_feeds)
 
     # Get the current comics data
-    comics_data = get_comics_data(URL)
-    political_data = get_comics_data(URL_POLITICAL)
+    comics_data, political_data = map(to_comic_records, get_all_comics_data(URL, URL_POLITICAL))
 
     # Create a set of political comic slugs for efficient lookup
-    political_slugs = {comic.get("slug") for comic in political_data if comic.get("slug")}
+    political_slugs = frozenset(filter(None, (comic.slug for comic in political_data)))
     print(f"\nFound {len(political_slugs)} political comics")
 
     # Prepare all feeds for validation
-    print("\n" + "=" * 60)
-    print("VALIDATING ALL RSS FEEDS")
-    print("=" * 60)
-    all_invalid_results = []
-
-    # Validate regular comics (excluding those that are political and excluded feeds)
-    print("\n--- Regular Comics ---")
-    regular_feeds = {}
-    for comic in comics_data:
-        name = comic.get("name", "Unknown")
-        slug = comic.get("slug", None)
-        author = comic.get("author", "")
-        feed_url = f"https://comiccaster.xyz/rss/{slug}" if slug else None
-
-        # Exclude comics that are political, in other languages, or in the exclusion list
-        if slug and slug not in INVALID_SLUGS and not is_other_language(slug, name,
-                                                                       author, feed_categories) and slug not in political_slugs:
-            if feed_url and not should_exclude_feed(feed_url, excluded_feeds):
-                regular_feeds[name] = feed_url
-            else:
-                print(f"  Excluded: {name} ({feed_url})")
+    print(f"\n{SEP}\nVALIDATING ALL RSS FEEDS\n{SEP}")
 
-    regular_valid, regular_invalid = validate_feeds_via_docker(regular_feeds)
-    all_invalid_results.extend(regular_invalid)
+    # Classify regular and other language comics in a single pass
+    # (excluding those that are political and excluded feeds)
+    print("\n--- Regular and Other Language Comics ---")
+    categorized = categorize_comics(comics_data, political_slugs, excluded_slugs, feed_categories)
+    regular_candidates, other_lang_candidates = categorized['regular'], categorized['other_lang']
+    regular_feeds = {comic.name: comic.feed_url for comic in regular_candidates}
+    other_lang_feeds = {comic.name: comic.feed_url for comic in other_lang_candidates}
 
-    # Validate other language comics (excluding those that are political and excluded feeds)
-    print("\n--- Comics in Other Languages ---")
-    other_lang_feeds = {}
-    for comic in comics_data:
-        name = comic.get("name", "Unknown")
-        slug = comic.get("slug", None)
-        author = comic.get("author", "")
-        feed_url = f"https://comiccaster.xyz/rss/{slug}" if slug else None
-
-        # Exclude comics that are political or in the exclusion list
-        if slug and slug not in INVALID_SLUGS and is_other_language(slug, name, author, feed_categories) and slug not in political_slugs:
-            if feed_url and not should_exclude_feed(feed_url, excluded_feeds):
-                other_lang_feeds[name] = feed_url
-            else:
-                print(f"  Excluded: {name} ({feed_url})")
-
-    other_lang_valid, other_lang_invalid = validate_feeds_via_docker(other_lang_feeds)
-    all_invalid_results.extend(other_lang_invalid)
-
-    # Validate political comics (excluding excluded feeds)
+    # Collect political comics (excluding excluded feeds)
     print("\n--- Political Comics ---")
     political_feeds = {}
+    political_candidates = []
+    excluded_log = []
     for comic in political_data:
-        name = comic.get("name", "Unknown")
-        slug = comic.get("slug", None)
-        feed_url = f"https://comiccaster.xyz/rss/{slug}" if slug else None
+        name, slug = comic.name, comic.slug
         if slug:
-            if feed_url and slug not in INVALID_SLUGS and not should_exclude_feed(feed_url, excluded_feeds):
-                political_feeds[name] = feed_url
+            if slug not in INVALID_SLUGS and slug not in excluded_slugs:
+                political_feeds[name] = comic.feed_url
+                political_candidates.append(comic)
             else:
-                print(f"  Excluded: {name} ({feed_url})")
+                excluded_log.append(f"  Excluded: {name} ({comic.feed_url})")
+    print_lines(excluded_log)
 
-    political_valid, political_invalid = validate_feeds_via_docker(political_feeds)
-    all_invalid_results.extend(political_invalid)
-
-    # Validate extra feeds (excluding excluded feeds)
-    validated_extra_feeds = {}  # Will store {name: {'url': url, 'author': author}}
-    extra_valid = []
-    extra_invalid = []
+    # Collect extra feeds (excluding excluded feeds)
+    filtered_extra_feeds = {}
     if extra_feeds:
         print("\n--- Extra Feeds ---")
-        # Filter out excluded extra feeds
-        filtered_extra_feeds = {}
+        excluded_log = []
         for feed in extra_feeds:
             url = feed.get('url')
             name = feed.get('name')
-            author = feed.get('author', '')
 
-            if not should_exclude_feed(url, excluded_feeds):
+            if url not in excluded_feeds:
                 filtered_extra_feeds[name] = url
             else:
-                print(f"  Excluded: {name} ({url})")
-
-        extra_valid, extra_invalid = validate_feeds_via_docker(filtered_extra_feeds)
-        all_invalid_results.extend(extra_invalid)
-
-        # Store validated extra feeds with their authors
-        for result in extra_valid:
-            # Find the original feed data to get the author
-            original_feed = next((f for f in extra_feeds if f.get('name') == result.name), None)
-            if original_feed:
-                validated_extra_feeds[result.name] = {
-                    'url': result.url,
-                    'author': original_feed.get('author', '')
-                }
+                excluded_log.append(f"  Excluded: {name} ({url})")
+        print_lines(excluded_log)
     else:
         print("\n--- Extra Feeds ---")
         print("No extra feeds to validate")
 
+    # Validate every category in one validator run so all feeds share its concurrency
+    feed_groups = {
+        'regular': regular_feeds,
+        'other_lang': other_lang_feeds,
+        'political': political_feeds,
+        'extra': filtered_extra_feeds,
+    }
+    print(f"\n--- Validating {sum(map(len, feed_groups.values()))} feeds ---")
+    # The validator is a single Node event loop, so concurrency can go well beyond a thread pool's
+    results = validate_feed_groups(
+        feed_groups,
+        timeout=int(os.environ.get("FEED_VALIDATOR_TIMEOUT_MS", 15000)),
+        concurrency=int(os.environ.get("FEED_VALIDATOR_CONCURRENCY", 32)),
+    )
+    regular_valid, regular_invalid = results['regular']
+    other_lang_valid, other_lang_invalid = results['other_lang']
+    political_valid, political_invalid = results['political']
+    extra_valid, extra_invalid = results['extra']
+    all_invalid_results = regular_invalid + other_lang_invalid + political_invalid + extra_invalid
+
+    # Store validated extra feeds with their authors
+    # (reversed so the first feed wins on duplicate names)
+    extra_by_name = {f.get('name'): f for f in reversed(extra_feeds)}
+    validated_extra_feeds = {}  # Will store {name: {'url': url, 'author': author}}
+    for result in extra_valid:
+        # Find the original feed data to get the author
+        original_feed = extra_by_name.get(result.name)
+        if original_feed:
+            validated_extra_feeds[result.name] = {
+                'url': result.url,
+                'author': original_feed.get('author', '')
+            }
+
     # Print overall validation summary
     total_valid = len(regular_valid) + len(other_lang_valid) + len(political_valid) + len(validated_extra_feeds)
     total_invalid = len(all_invalid_results)
-    print(f"\n{'=' * 60}")
-    print(f"OVERALL VALIDATION SUMMARY")
-    print(f"{'=' * 60}")
-    print(f"Total feeds validated: {total_valid + total_invalid}")
-    print(f"✓ Valid: {total_valid} ({total_valid / (total_valid + total_invalid) * 100:.1f}%)")
-    print(f"✗ Invalid: {total_invalid} ({total_invalid / (total_valid + total_invalid) * 100:.1f}%)")
+    print("\n".join([
+        f"\n{SEP}",
+        "OVERALL VALIDATION SUMMARY",
+        SEP,
+        f"Total feeds validated: {total_valid + total_invalid}",
+        f"✓ Valid: {total_valid} ({total_valid / (total_valid + total_invalid) * 100:.1f}%)",
+        f"✗ Invalid: {total_invalid} ({total_invalid / (total_valid + total_invalid) * 100:.1f}%)",
+    ]))
 
     # Save failed feeds report
-    save_failed_feeds_report(all_invalid_results, get_failed_feeds_path())
-
-    # Separate regular comics from other languages (only valid ones, excluding political)
-    regular_comics = []
-    other_language_comics = []
+    save_failed_feeds_report(all_invalid_results, FAILED_FEEDS_PATH)
 
-    # Use only validated comics
-    valid_regular_names = {result.name for result in regular_valid}
-    valid_other_lang_names = {result.name for result in other_lang_valid}
-
-    for comic in comics_data:
-        name = comic.get("name", "Unknown")
-        slug = comic.get("slug", None)
-        feed_url = f"https://comiccaster.xyz/rss/{slug}" if slug else None
-
-        # Only include if not political and not excluded
-        if slug not in political_slugs and feed_url and not should_exclude_feed(feed_url, excluded_feeds):
-            if name in valid_regular_names:
-                regular_comics.append(comic)
-            elif name in valid_other_lang_names:
-                other_language_comics.append(comic)
-
-    # Filter political comics to only valid ones and not excluded
-    valid_political_names = {result.name for result in political_valid}
-    political_data = [comic for comic in political_data if comic.get("name") in valid_political_names]
+    # Keep only the validated candidates collected before validation
+    # (they are already filtered for political, invalid and excluded slugs)
+    regular_comics = filter_valid_comics(regular_candidates, regular_valid)
+    other_language_comics = filter_valid_comics(other_lang_candidates, other_lang_valid)
+    political_data = filter_valid_comics(political_candidates, political_valid)
 
     # Count totals for the description (all unique entries)
     total_regular = len(regular_comics)
@@ -385,77 +621,47 @@ def create_updated_settings():
 
     # Comics field - sort by name
     comics_options = []
-    for comic in sorted(regular_comics, key=lambda x: x.get("name", "Unknown").lower()):
-        name = comic.get("name", "Unknown")
-        author = comic.get("author", "")
-        slug = comic.get("slug", None)
-        if slug:
+    for comic in regular_comics:
+        if comic.slug:
+            name, author = comic.name, comic.author
             display_name = f"{name} by {author}" if author and author != name else name
-            comics_options.append({display_name: f"https://comiccaster.xyz/rss/{slug}"})
+            comics_options.append((display_name.lower(), display_name, comic.feed_url))
 
     # Add validated extra feeds to comics options WITH author info
+    extra_options = []
     for name, feed_data in validated_extra_feeds.items():
         author = feed_data['author']
         url = feed_data['url']
         display_name = f"{name} by {author}" if author and author != name else name
-        comics_options.append({display_name: url})
+        extra_options.append((display_name.lower(), display_name, url))
 
-    # Sort all comics options by name (case insensitive)
-    comics_options.sort(key=lambda x: list(x.keys())[0].lower())
+    # Sort both lists together by name (case insensitive)
+    comics_options = to_select_options(comics_options, extra_options)
 
-    comics_field = {
-        'keyname': 'comics',
-        'field_type': 'select',
-        'name': f'Comics: {len(comics_options)}',
-        'multiple': True,
-        'help_text': 'Use ⌘+click (Mac) or ctrl+click (Windows) to select multiple items. Use Shift+click to select a whole range at once.',
-        'optional': True,
-        'options': comics_options
-    }
+    comics_field = multi_select_field('comics', f'Comics: {len(comics_options)}', comics_options)
     custom_fields.append(comics_field)
 
     # Comics other languages field - sort by name
     other_lang_options = []
-    for comic in sorted(other_language_comics, key=lambda x: x.get("name", "Unknown").lower()):
-        name = comic.get("name", "Unknown")
-        author = comic.get("author", "")
-        slug = comic.get("slug", "")
-        if slug:
+    for comic in other_language_comics:
+        if comic.slug:
+            name, author = comic.name, comic.author
             display_name = f"{name} by {author}" if author and author != name else name
-            feed_url = f"https://comiccaster.xyz/rss/{slug}" if slug else None
-            other_lang_options.append({display_name: feed_url})
+            other_lang_options.append((comic.name_lower, display_name, comic.feed_url))
+    other_lang_options = to_select_options(other_lang_options)
 
-    other_lang_field = {
-        'keyname': 'comics_other_languages',
-        'field_type': 'select',
-        'name': f'Comics in other languages: {len(other_lang_options)}',
-        'multiple': True,
-        'help_text': 'Use ⌘+click (Mac) or ctrl+click (Windows) to select multiple items. Use Shift+click to select a whole range at once.',
-        'optional': True,
-        'options': other_lang_options
-    }
+    other_lang_field = multi_select_field('comics_other_languages', f'Comics in other languages: {len(other_lang_options)}', other_lang_options)
     custom_fields.append(other_lang_field)
 
     # Political comics field - sort by name
     political_options = []
-    for comic in sorted(political_data, key=lambda x: x.get("name", "Unknown").lower()):
-        name = comic.get("name", "Unknown")
-        author = comic.get("author", "")
-        slug = comic.get("slug", "unknown")
+    for comic in political_data:
+        name, author = comic.name, comic.author
         display_name = f"{name} by {author}" if author and author != name else name
-        feed_url = f"https://comiccaster.xyz/rss/{slug}" if slug else None
+        political_options.append((comic.name_lower, display_name, comic.feed_url))
+    political_options = to_select_options(political_options)
 
-        political_options.append({display_name: feed_url})
-
-    political_field = {
-        'keyname': 'comics_political',
-        'field_type': 'select',
-        'name': f'Political Comics: {len(political_options)}',
-        'multiple': True,
-        'help_text': 'Use ⌘+click (Mac) or ctrl+click (Windows) to select multiple items. Use Shift+click to select a whole range at once.',
-        'optional': True,
-        'options': political_options
-    }
+    political_field = multi_select_field('comics_political', f'Political Comics: {len(political_options)}', political_options)
     custom_fields.append(political_field)
 
     # Only show latest field
@@ -517,37 +723,28 @@ def create_updated_settings():
     custom_fields.append(image_filter)
 
     # Load existing settings.yml and update only custom_fields
-    settings_path = get_settings_path()
+    settings_path = SETTINGS_PATH
     if not settings_path.exists():
         print(f"[!] settings.yml not found at {settings_path}")
         raise SystemExit(1)
 
     print(f"\nUpdating: {settings_path.absolute()}")
 
-    with open(settings_path, 'r', encoding='utf-8') as f:
-        settings = yaml.safe_load(f)
-
-    settings['custom_fields'] = custom_fields
-
-    def represent_dict_order(dumper, data):
-        return dumper.represent_mapping('tag:yaml.org,2002:map', data.items())
-
-    yaml.add_representer(dict, represent_dict_order)
-
-    with open(settings_path, 'w', encoding='utf-8') as f:
-        yaml.dump(settings, f, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
+    write_settings(settings_path, custom_fields)
 
     print(f"✓ Successfully updated {settings_path}")
 
     # Print summary
-    print(f"\n" + "=" * 60)
-    print("FINAL SUMMARY")
-    print("=" * 60)
-    print(f"Regular comics: {total_regular}")
-    print(f"Other language comics: {total_other_lang}")
-    print(f"Political comics: {total_political}")
-    print(f"Extra feeds (validated): {total_extra}")
-    print(f"Total unique comics: {total_all}")
+    print("\n".join([
+        f"\n{SEP}",
+        "FINAL SUMMARY",
+        SEP,
+        f"Regular comics: {total_regular}",
+        f"Other language comics: {total_other_lang}",
+        f"Political comics: {total_political}",
+        f"Extra feeds (validated): {total_extra}",
+        f"Total unique comics: {total_all}",
+    ]))
 
     total_valid = len(regular_valid) + len(other_lang_valid) + len(political_valid) + len(extra_valid)
     total_invalid = len(regular_invalid) + len(other_lang_invalid) + len(political_invalid) + len(extra_invalid)
@@ -562,9 +759,10 @@ def create_updated_settings():
 
     from generate_comic_overview import generate_overview
 
-    comics_author = {c.get("name"): c.get("author", "") for c in comics_data}
-    political_author = {c.get("name"): c.get("author", "") for c in political_data}
-    extra_author = {f.get("name"): f.get("author", "") for f in extra_feeds} if extra_feeds else {}
+    # Authors come from the already validated comics, not another pass over the full lists
+    comics_author = {c.name: c.author for c in chain(regular_comics, other_language_comics)}
+    political_author = {c.name: c.author for c in political_data}
+    extra_author = {name: feed_data['author'] for name, feed_data in validated_extra_feeds.items()}
 
     overview_data = []
     for category, results, author_map in [
@@ -584,11 +782,10 @@ def create_updated_settings():
                 "category": category,
             })
     # save the cache — standalone mode reads this back
-    data_dir = get_data_dir()
+    data_dir = DATA_DIR
     data_dir.mkdir(exist_ok=True)
     json_path = data_dir / "comic_overview_data.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(overview_data, f, ensure_ascii=False, indent=2)
+    write_atomic(json_path, dumps_json(overview_data))
     print(f"✓ Cached overview data: {json_path}")
 
     # Flat list of every currently-validated feed URL, hosted via GitHub raw content
@@ -598,22 +795,23 @@ def create_updated_settings():
         r.url for r in (regular_valid + other_lang_valid + political_valid + extra_valid)
     })
     urls_path = data_dir / "comic_urls.json"
-    with open(urls_path, "w", encoding="utf-8") as f:
-        json.dump(valid_urls, f, ensure_ascii=False, indent=2)
+    write_atomic(urls_path, dumps_json(valid_urls))
     print(f"✓ Wrote {len(valid_urls)} validated feed URLs: {urls_path}")
 
+    # Skip the HTML/Atom render when the overview is identical to the last rendered one
+    digest = overview_digest(overview_data)
+    if (OVERVIEW_HASH_PATH.exists() and INDEX_PATH.exists() and ATOM_PATH.exists()
+            and OVERVIEW_HASH_PATH.read_text(encoding='utf-8').strip() == digest):
+        print("\n✓ Overview data and renderers unchanged; skipping index.html and Atom feed render "
+              "(the Atom feed's <updated> timestamps and entry ids are not refreshed)")
+        return
+
     # render the HTML from it
-    generate_overview(overview_data, settings_path.parent.parent / "index.html")
+    generate_overview(overview_data, INDEX_PATH)
     # Generate RSS aggregator feed with top 6 comics
     from generate_rss_aggregator import generate_atom_feed
-    atom_output_path = data_dir / "demo_data.atom"
-    generate_atom_feed(
-        comics=overview_data,
-        output_path=atom_output_path,
-        comics_per_entry=4,
-        entries=12,
-        mode="recent"  # or "random" for random selection
-    )
+    generate_atom_feed(comics=overview_data, output_path=ATOM_PATH, **ATOM_FEED_OPTIONS)
+    write_atomic(OVERVIEW_HASH_PATH, digest + "\n")
 
 
 if __name__ == "__main__":
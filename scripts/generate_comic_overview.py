@@ -10,11 +10,17 @@ Two modes:
 """
 
 import json
+import re
 import argparse
 from pathlib import Path
 from html import escape
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Category config  —  badge colour per category
@@ -33,30 +39,46 @@ DEFAULT_COLOUR = "#7c6aff"
 # Card + page rendering
 # ---------------------------------------------------------------------------
 
+def _escape(s: str) -> str:
+    """html.escape, but hand back strings with nothing to escape (most names and URLs) untouched"""
+    if '&' in s or '<' in s or '>' in s or '"' in s or "'" in s:
+        return escape(s)
+    return s
+
+
+def _render_badge(category: str) -> str:
+    col = CATEGORY_COLOURS.get(category, DEFAULT_COLOUR)
+    return f'<span class="badge" style="background:{col}22; color:{col}; border-color:{col}44">{_escape(category)}</span>'
+
+
+# badges for the known categories never change, so build them once
+CATEGORY_BADGES = {cat: _render_badge(cat) for cat in CATEGORY_COLOURS}
+
+
 def _render_card(comic: dict) -> str:
-    name       = escape(comic.get("name") or "")
-    author     = escape(comic.get("author") or "")
-    title      = escape(comic.get("title") or name)
+    name       = _escape(comic.get("name") or "")
+    author     = _escape(comic.get("author") or "")
+    title      = _escape(comic.get("title") or name)
     category   = comic.get("category") or "Comics"
-    cat_esc    = escape(category)
+    cat_esc    = _escape(category)
     image_url  = comic.get("image_url")
     caption    = comic.get("caption")
     link       = comic.get("link")
     error      = comic.get("error")
 
     if image_url:
-        img_html = f'<img src="{escape(image_url)}" alt="{title}" loading="lazy">'
+        img_html = f'<img src="{_escape(image_url)}" alt="{title}" loading="lazy">'
     else:
         img_html = '<div class="no-image">&#x1f5bc; No image</div>'
 
-    col          = CATEGORY_COLOURS.get(category, DEFAULT_COLOUR)
-    badge_html   = f'<span class="badge" style="background:{col}22; color:{col}; border-color:{col}44">{cat_esc}</span>'
+    badge_html   = CATEGORY_BADGES.get(category) or _render_badge(category)
     author_html  = f'<span class="author">by {author}</span>'                                                          if author  else ""
-    caption_html = f'<p class="caption">"{escape(caption)}"</p>'                                                       if caption else ""
-    link_html    = f'<a href="{escape(link)}" target="_blank" rel="noopener" class="read-link">Read &rarr;</a>'       if link    else ""
-    error_html   = f'<div class="error-banner">{escape(error)}</div>'                                                   if error   else ""
+    caption_html = f'<p class="caption">"{_escape(caption)}"</p>'                                                       if caption else ""
+    link_html    = f'<a href="{_escape(link)}" target="_blank" rel="noopener" class="read-link">Read &rarr;</a>'       if link    else ""
+    error_html   = f'<div class="error-banner">{_escape(error)}</div>'                                                   if error   else ""
     error_class  = " has-error" if error else ""
 
+    # a single f-string: CPython builds the whole card in one BUILD_STRING
     return (
         f'<article class="card{error_class}" data-name="{name}" data-category="{cat_esc}">\n'
         f'  <div class="card-image">{img_html}</div>\n'
@@ -78,8 +100,8 @@ def _render_card(comic: dict) -> str:
 def _render_cat_button(cat: str) -> str:
     col = CATEGORY_COLOURS.get(cat, DEFAULT_COLOUR)
     return (
-        f'  <button class="cat-btn" data-category="{escape(cat)}" '
-        f'style="border-color:{col}44; color:{col}">&#x25cf; {escape(cat)}</button>'
+        f'  <button class="cat-btn" data-category="{_escape(cat)}" '
+        f'style="border-color:{col}44; color:{col}">&#x25cf; {_escape(cat)}</button>'
     )
 
 def _render_plugin_badge() -> str:
@@ -115,28 +137,19 @@ def _render_plugin_badge() -> str:
 </div>
 '''
 
-def _render_page(comics: list[dict]) -> str:
-    cards = "\n".join(_render_card(c) for c in comics)
-    total = len(comics)
-    ok    = sum(1 for c in comics if "error" not in c)
-    now   = datetime.now().strftime("%Y-%m-%d %H:%M")
 
-    # only show buttons for categories that actually exist in the data
-    present_cats = [cat for cat in ["Comics", "Other Languages", "Political"]
-                        if any(c.get("category") == cat for c in comics)]
-    cat_buttons  = "\n".join(_render_cat_button(cat) for cat in present_cats)
+def _minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace; the CSS here has no strings where spacing matters"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};])\s*', r'\1', css).strip()
 
-    return f"""\
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Comic Library &#x2014; Latest</title>
-<style>
-  *, *::before, *::after {{ box-sizing: border-box; margin: 0; padding: 0; }}
 
-  :root {{
+# Static parts of the page, built once at import. Only PAGE_TOOLBAR has placeholders.
+PAGE_CSS = """\
+  *, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
+
+  :root {
     --bg:         #0f1117;
     --surface:    #1a1d27;
     --surface-hi: #232736;
@@ -148,18 +161,18 @@ def _render_page(comics: list[dict]) -> str:
     --error-bg:   #2a1a1a;
     --error-text: #e07070;
     --radius:     12px;
-  }}
+  }
 
-  body {{
+  body {
     font-family: "Segoe UI", system-ui, sans-serif;
     background: var(--bg);
     color: var(--text);
     min-height: 100vh;
     line-height: 1.5;
-  }}
+  }
 
   /* ---- header ---- */
-  header {{
+  header {
     background: var(--surface);
     border-bottom: 1px solid var(--border);
     padding: 1.25rem 2rem;
@@ -168,8 +181,8 @@ def _render_page(comics: list[dict]) -> str:
     justify-content: space-between;
     flex-wrap: wrap;
     gap: 0.5rem;
-  }}
-  header h1 {{
+  }
+  header h1 {
     font-size: 1.4rem;
     font-weight: 600;
     color: var(--accent-hi);
@@ -177,26 +190,26 @@ def _render_page(comics: list[dict]) -> str:
     display: flex;
     align-items: center;
     gap: 0.75rem;
-  }}
+  }
   
-  header h1 .logo {{
+  header h1 .logo {
     width: 32px;
     height: 32px;
     border-radius: 8px;
     object-fit: cover;
     border: 1px solid var(--border);
-  }}
-  .header-meta {{ font-size: 0.82rem; color: var(--text-dim); }}
+  }
+  .header-meta { font-size: 0.82rem; color: var(--text-dim); }
 
   /* ---- toolbar ---- */
-  .toolbar {{
+  .toolbar {
     padding: 1rem 2rem;
     display: flex;
     align-items: center;
     gap: 0.75rem;
     flex-wrap: wrap;
-  }}
-  .toolbar input {{
+  }
+  .toolbar input {
     flex: 1 1 220px;
     max-width: 380px;
     background: var(--surface);
@@ -206,20 +219,20 @@ def _render_page(comics: list[dict]) -> str:
     padding: 0.5rem 0.85rem;
     font-size: 0.9rem;
     outline: none;
-  }}
-  .toolbar input:focus          {{ border-color: var(--accent); }}
-  .toolbar input::placeholder   {{ color: var(--text-dim); }}
-  .toolbar select {{
+  }
+  .toolbar input:focus          { border-color: var(--accent); }
+  .toolbar input::placeholder   { color: var(--text-dim); }
+  .toolbar select {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: var(--radius);
     color: var(--text);
     padding: 0.5rem 0.75rem;
     font-size: 0.9rem;
-  }}
+  }
 
   /* ---- category filter buttons ---- */
-  .cat-btn {{
+  .cat-btn {
     background: transparent;
     border: 1px solid;
     border-radius: 20px;
@@ -229,23 +242,23 @@ def _render_page(comics: list[dict]) -> str:
     cursor: pointer;
     transition: opacity .15s;
     white-space: nowrap;
-  }}
-  .cat-btn:hover            {{ opacity: 0.8; }}
-  .cat-btn.active           {{ opacity: 1; }}
-  .cat-btn:not(.active)     {{ opacity: 0.4; }}
+  }
+  .cat-btn:hover            { opacity: 0.8; }
+  .cat-btn.active           { opacity: 1; }
+  .cat-btn:not(.active)     { opacity: 0.4; }
 
   /* ---- grid ---- */
-  .grid {{
+  .grid {
     display: grid;
     grid-template-columns: repeat(auto-fill, minmax(260px, 1fr));
     gap: 1.25rem;
     padding: 0 2rem 3rem;
     max-width: 1400px;
     margin: 0 auto;
-  }}
+  }
 
   /* ---- card ---- */
-  .card {{
+  .card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: var(--radius);
@@ -253,11 +266,11 @@ def _render_page(comics: list[dict]) -> str:
     display: flex;
     flex-direction: column;
     transition: border-color .2s, transform .15s;
-  }}
-  .card:hover              {{ border-color: var(--accent); transform: translateY(-2px); }}
-  .card.has-error          {{ opacity: 0.6; }}
+  }
+  .card:hover              { border-color: var(--accent); transform: translateY(-2px); }
+  .card.has-error          { opacity: 0.6; }
 
-  .card-image {{
+  .card-image {
     width: 100%;
     aspect-ratio: 1 / 1;
     background: var(--surface-hi);
@@ -265,24 +278,24 @@ def _render_page(comics: list[dict]) -> str:
     display: flex;
     align-items: center;
     justify-content: center;
-  }}
-  .card-image img          {{ width: 100%; height: 100%; object-fit: cover; display: block; }}
-  .card-image .no-image    {{ color: var(--text-dim); font-size: 0.85rem; }}
+  }
+  .card-image img          { width: 100%; height: 100%; object-fit: cover; display: block; }
+  .card-image .no-image    { color: var(--text-dim); font-size: 0.85rem; }
 
-  .card-body {{
+  .card-body {
     padding: 0.85rem 1rem 1rem;
     display: flex;
     flex-direction: column;
     flex: 1;
     gap: 0.3rem;
-  }}
-  .card-title {{ font-size: 1rem; font-weight: 600; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }}
-  .card-meta  {{ font-size: 0.78rem; color: var(--text-dim); display: flex; gap: 0.6rem; flex-wrap: wrap; align-items: center; }}
-  .source     {{ font-weight: 600; color: var(--accent-hi); }}
-  .author     {{ color: var(--text-dim); }}
+  }
+  .card-title { font-size: 1rem; font-weight: 600; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+  .card-meta  { font-size: 0.78rem; color: var(--text-dim); display: flex; gap: 0.6rem; flex-wrap: wrap; align-items: center; }
+  .source     { font-weight: 600; color: var(--accent-hi); }
+  .author     { color: var(--text-dim); }
 
   /* ---- badge (inside card) ---- */
-  .badge {{
+  .badge {
     display: inline-block;
     border: 1px solid;
     border-radius: 10px;
@@ -290,22 +303,36 @@ def _render_page(comics: list[dict]) -> str:
     font-size: 0.72rem;
     font-weight: 600;
     white-space: nowrap;
-  }}
+  }
+
+  .caption    { font-size: 0.82rem; color: var(--text-dim); font-style: italic; margin-top: auto; }
+  .read-link  { display: inline-block; margin-top: 0.5rem; font-size: 0.85rem; color: var(--accent-hi); text-decoration: none; font-weight: 600; }
+  .read-link:hover { color: #fff; }
 
-  .caption    {{ font-size: 0.82rem; color: var(--text-dim); font-style: italic; margin-top: auto; }}
-  .read-link  {{ display: inline-block; margin-top: 0.5rem; font-size: 0.85rem; color: var(--accent-hi); text-decoration: none; font-weight: 600; }}
-  .read-link:hover {{ color: #fff; }}
+  .error-banner { background: var(--error-bg); color: var(--error-text); font-size: 0.78rem; padding: 0.4rem 1rem; text-align: center; }
 
-  .error-banner {{ background: var(--error-bg); color: var(--error-text); font-size: 0.78rem; padding: 0.4rem 1rem; text-align: center; }}
+  @media (max-width: 600px) {
+    header, .toolbar { padding-left: 1rem; padding-right: 1rem; }
+    .grid { padding: 0 1rem 2rem; grid-template-columns: 1fr; }
+  }
+"""
 
-  @media (max-width: 600px) {{
-    header, .toolbar {{ padding-left: 1rem; padding-right: 1rem; }}
-    .grid {{ padding: 0 1rem 2rem; grid-template-columns: 1fr; }}
-  }}
+PAGE_HEAD = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>Comic Library &#x2014; Latest</title>
+<style>
+""" + _minify_css(PAGE_CSS) + """
 </style>
 </head>
 <body>
 
+"""
+
+PAGE_TOOLBAR = """\
 <header>
   <h1><img src="https://github.com/ExcuseMi/trmnl-comic-library-plugin/blob/main/assets/plugin-images/180935_icon.png?raw=true" class="logo" /> Comic Library</h1>
   <span class="header-meta">{ok} / {total} feeds loaded &middot; generated {now}</span>
@@ -322,79 +349,139 @@ def _render_page(comics: list[dict]) -> str:
 </div>
 
 <div class="grid" id="grid">
-{cards}
+"""
+
+PAGE_FOOTER = """
 </div>
 
 <script>
-(function() {{
+(function() {
   const grid    = document.getElementById("grid");
   const search  = document.getElementById("search");
   const sort    = document.getElementById("sort");
   const catBtns = document.querySelectorAll(".cat-btn");
   const cards   = Array.from(grid.children);
 
+  // lowercase the searchable text once instead of walking each card's DOM per keystroke
+  cards.forEach(card => {
+    card.__search = card.textContent.toLowerCase();
+    card.__name   = (card.dataset.name || "").toLowerCase();
+    card.__err    = card.classList.contains("has-error") ? 1 : 0;
+  });
+
   // start with all categories active
   const active = new Set(Array.from(catBtns).map(b => b.dataset.category));
 
-  function syncBtnStyles() {{
+  function syncBtnStyles() {
     catBtns.forEach(b => b.classList.toggle("active", active.has(b.dataset.category)));
-  }}
+  }
 
-  function sortKey(card, mode) {{
-    const name     = (card.dataset.name || "").toLowerCase();
-    const hasError = card.classList.contains("has-error") ? "1" : "0";
-    if (mode === "alpha-asc")   return name;
-    if (mode === "alpha-desc")  return "\\uffff".repeat(40).slice(name.length) + name;
-    /* errors-last */            return hasError + name;
-  }}
+  const comparators = {
+    "alpha-asc":   (a, b) => a.__name.localeCompare(b.__name),
+    "alpha-desc":  (a, b) => b.__name.localeCompare(a.__name),
+    "errors-last": (a, b) => (a.__err - b.__err) || a.__name.localeCompare(b.__name),
+  };
 
-  function render() {{
+  function render() {
     const q    = search.value.toLowerCase();
     const mode = sort.value;
 
-    const filtered = cards.filter(card => {{
+    const filtered = cards.filter(card => {
       if (!active.has(card.dataset.category)) return false;
-      if (q && !card.textContent.toLowerCase().includes(q)) return false;
+      if (q && !card.__search.includes(q)) return false;
       return true;
-    }});
+    });
+
+    filtered.sort(comparators[mode] || comparators["errors-last"]);
 
-    filtered.sort((a, b) => sortKey(a, mode).localeCompare(sortKey(b, mode)));
-    filtered.forEach(card => grid.appendChild(card));
+    // only the matching cards stay attached; the rest live in `cards` and cost no layout
+    const frag = document.createDocumentFragment();
+    filtered.forEach(card => frag.appendChild(card));
+    grid.replaceChildren(frag);
+  }
 
-    const visible = new Set(filtered);
-    cards.forEach(card => {{ card.style.display = visible.has(card) ? "" : "none"; }});
-  }}
+  // don't re-filter on every keystroke while the user is still typing
+  let searchTimer;
+  function onSearch() {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(render, 60);
+  }
 
   // category toggle: click once = isolate, click again = back to all
-  catBtns.forEach(btn => {{
-    btn.addEventListener("click", () => {{
+  catBtns.forEach(btn => {
+    btn.addEventListener("click", () => {
       const cat = btn.dataset.category;
 
-      if (active.size === 1 && active.has(cat)) {{
+      if (active.size === 1 && active.has(cat)) {
         // already isolated on this one — select all
         catBtns.forEach(b => active.add(b.dataset.category));
-      }} else {{
+      } else {
         // isolate to just this category
         active.clear();
         active.add(cat);
-      }}
+      }
 
       syncBtnStyles();
       render();
-    }});
-  }});
+    });
+  });
 
-  search.addEventListener("input",  render);
+  search.addEventListener("input",  onSearch);
   sort.addEventListener("change",   render);
   syncBtnStyles();
   render();
-}})();
+})();
 </script>
-{_render_plugin_badge()}
+""" + _render_plugin_badge() + """
 </body>
 </html>"""
 
 
+def _page_stats(comics: list[dict]) -> tuple[int, set]:
+    """Count the comics without errors and collect the categories present, in one pass"""
+    ok         = 0
+    categories = set()
+    for c in comics:
+        if "error" not in c:
+            ok += 1
+        categories.add(c.get("category"))
+    return ok, categories
+
+
+def _render_header(total: int, ok: int, categories: set) -> str:
+    """Everything up to and including the opening of the card grid"""
+    now = f"{datetime.now():%Y-%m-%d %H:%M}"
+
+    # only show buttons for categories that actually exist in the data
+    present_cats = [cat for cat in ["Comics", "Other Languages", "Political"] if cat in categories]
+    cat_buttons  = "\n".join(_render_cat_button(cat) for cat in present_cats)
+
+    return PAGE_HEAD + PAGE_TOOLBAR.format(ok=ok, total=total, now=now, cat_buttons=cat_buttons)
+
+
+def _render_cards(comics: list[dict]):
+    """Yield the cards one at a time, separated by blank lines"""
+    sep = ""
+    for comic in comics:
+        yield sep
+        yield _render_card(comic)
+        sep = "\n"
+
+
+def _iter_page(comics: list[dict], ok: int, categories: set):
+    """Yield the page piece by piece: header, cards, footer"""
+    yield _render_header(len(comics), ok, categories)
+    yield from _render_cards(comics)
+    yield PAGE_FOOTER
+
+
+def _write_page(f, comics: list[dict]) -> int:
+    """Stream the page into f so the cards are never joined into one big string. Returns the ok count."""
+    ok, categories = _page_stats(comics)
+    f.writelines(_iter_page(comics, ok, categories))
+    return ok
+
+
 # ---------------------------------------------------------------------------
 # Public entry point  —  called from generate-options.py
 # ---------------------------------------------------------------------------
@@ -408,11 +495,9 @@ def generate_overview(comics: list[dict], output_path: Path):
     print("GENERATING COMIC OVERVIEW")
     print(f"{'=' * 60}")
 
-    ok = sum(1 for c in comics if "error" not in c)
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        ok = _write_page(f, comics)
     print(f"  {ok}/{len(comics)} comics have images")
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(_render_page(comics))
     print(f"✓ Comic overview written: {output_path}")
 
 
@@ -444,14 +529,12 @@ if __name__ == "__main__":
         print("    Run generate-options.py first to create it.")
         raise SystemExit(1)
 
-    with open(args.json, encoding="utf-8") as f:
-        comics = json.load(f)
+    data   = args.json.read_bytes()
+    comics = orjson.loads(data) if orjson else json.loads(data)
 
     print(f"[*] Loaded {len(comics)} comics from {args.json}")
 
-    ok = sum(1 for c in comics if "error" not in c)
+    with open(args.output, "w", encoding="utf-8", newline="") as f:
+        ok = _write_page(f, comics)
     print(f"  {ok}/{len(comics)} have images")
-
-    with open(args.output, "w", encoding="utf-8") as f:
-        f.write(_render_page(comics))
     print(f"✓ Written: {args.output}")
\ No newline at end of file
@@ -10,12 +10,54 @@ Library:    from generate_rss_aggregator import generate_atom_feed
 """
 
 import json
+import os
 import random
 import argparse
+from itertools import cycle, islice
 from pathlib import Path
 from datetime import datetime, timezone
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from xml.sax.saxutils import escape as xml_escape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+SITE_URL = 'https://excusemi.github.io/trmnl-comic-library-plugin/'
+
+# The feed is a flat list of entries, so it is written from templates rather than
+# built as an element tree just to serialise it again
+ATOM_HEAD = """\
+<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="en">
+  <title>Comic Library</title>
+  <link href="{site}" rel="alternate" />
+  <id>{site}</id>
+  <updated>{updated}</updated>
+"""
+
+ATOM_ENTRY = """\
+  <entry>
+    <title>{title}</title>
+    <link href="{site}" rel="alternate" />
+    <updated>{updated}</updated>
+    <id>{id}</id>
+    <summary type="html">{summary}</summary>
+  </entry>
+"""
+
+ATOM_TAIL = "</feed>"
+
+
+def _src_attr(url: str) -> str:
+    """
+    Make an image URL safe inside a double-quoted src attribute.
+
+    Feed image URLs arrive already HTML-escaped (&amp; in query strings), so a full
+    html.escape would double-escape them; only a stray quote can break the attribute.
+    """
+    return url.replace('"', '&quot;')
 
 
 def generate_atom_feed(
@@ -67,36 +109,21 @@ def generate_atom_feed(
         else:
             # Not enough comics, wrap around
             repeats = (total_comics_needed // len(valid)) + 1
-            selected_all = (valid * repeats)[:total_comics_needed]
+            selected_all = list(islice(cycle(valid), total_comics_needed))
             print(f"  Warning: Not enough comics, wrapping around {repeats} times")
 
-    # Build Atom feed
-    feed = Element('feed')
-    feed.set('xmlns', 'http://www.w3.org/2005/Atom')
-    feed.set('xml:lang', 'en')
+    # One timestamp for the whole feed
+    now = datetime.now(timezone.utc)
+    updated = now.strftime('%Y-%m-%dT%H:%M:%SZ')
+    entry_title = now.strftime('%Y-%m-%d')
+    id_day = now.strftime('%Y%m%d')
 
-    SubElement(feed, 'title').text = 'Comic Library'
-
-    link = SubElement(feed, 'link')
-    link.set('href', 'https://excusemi.github.io/trmnl-comic-library-plugin/')
-    link.set('rel', 'alternate')
-
-    SubElement(feed, 'id').text = 'https://excusemi.github.io/trmnl-comic-library-plugin/'
-    SubElement(feed, 'updated').text = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    # Use custom caption
+    caption = 'All your comics in 1 plugin'
 
     # Create multiple entries
+    entry_xml = []
     for entry_idx in range(entries):
-        entry = SubElement(feed, 'entry')
-
-        SubElement(entry, 'title').text = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-
-        entry_link = SubElement(entry, 'link')
-        entry_link.set('href', 'https://excusemi.github.io/trmnl-comic-library-plugin/')
-        entry_link.set('rel', 'alternate')
-
-        SubElement(entry, 'updated').text = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        SubElement(entry, 'id').text = f'comic-library-{datetime.now(timezone.utc).strftime("%Y%m%d")}-{entry_idx}'
-
         # Get comics for this specific entry
         start_idx = entry_idx * comics_per_entry
         end_idx = start_idx + comics_per_entry
@@ -107,37 +134,31 @@ def generate_atom_feed(
         else:
             print(f"  Entry {entry_idx + 1}: Comics {start_idx + 1}-{end_idx} (recent)")
 
-        # Build HTML with images for this entry
-        summary = SubElement(entry, 'summary')
-        summary.set('type', 'html')
-
-        html = ''
-        for comic in entry_comics:
-            img_url = comic.get('image_url')
-            # Use custom caption
-            caption = 'All your comics in 1 plugin'
-
-            # Each image on its own line with title/alt for caption
-            html += f'<img src="{img_url}" title="{caption}" alt="{caption}" /><br/>'
-
-        # Keep HTML escaped - it will become __content__ string like xkcd
-        summary.text = html
-
-    # Pretty print XML
-    rough_string = tostring(feed, encoding='utf-8')
-    reparsed = minidom.parseString(rough_string)
-    pretty_xml = reparsed.toprettyxml(indent="  ", encoding='utf-8').decode('utf-8')
-
-    # Remove extra blank lines
-    lines = [line for line in pretty_xml.split('\n') if line.strip()]
-    pretty_xml = '\n'.join(lines)
-
-    # NOTE: We do NOT un-escape HTML here. Keeping it escaped (&lt;img&gt;) makes
-    # the parser store it as __content__ string (like xkcd) instead of parsing it
-    # into structured objects. The transform's regex will work on the __content__ string.
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(pretty_xml)
+        # Each image on its own line with title/alt for caption. When comics repeat
+        # (random choices or wrap-around) an entry still shows each image only once.
+        image_urls = dict.fromkeys(comic.get("image_url") for comic in entry_comics)
+        html = ''.join(
+            f'<img src="{_src_attr(image_url)}" title="{caption}" alt="{caption}" /><br/>'
+            for image_url in image_urls
+        )
+
+        # NOTE: We do NOT un-escape HTML here. Keeping it escaped (&lt;img&gt;) makes
+        # the parser store it as __content__ string (like xkcd) instead of parsing it
+        # into structured objects. The transform's regex will work on the __content__ string.
+        entry_xml.append(ATOM_ENTRY.format(
+            site=SITE_URL,
+            title=entry_title,
+            updated=updated,
+            id=f'comic-library-{id_day}-{entry_idx}',
+            summary=xml_escape(html),
+        ))
+
+    feed_xml = ATOM_HEAD.format(site=SITE_URL, updated=updated) + ''.join(entry_xml) + ATOM_TAIL
+
+    # Write next to the target and swap it in, so pollers never see a half-written feed
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+    tmp_path.write_bytes(feed_xml.encode('utf-8'))
+    os.replace(tmp_path, output_path)
 
     print(f"\n✓ Atom feed written: {output_path}")
     print(f"  Contains {entries} entries with {comics_per_entry} comics each")
@@ -175,8 +196,8 @@ if __name__ == "__main__":
         print("  Run generate-options.py first to create it.")
         raise SystemExit(1)
 
-    with open(json_path, encoding='utf-8') as f:
-        comics = json.load(f)
+    data = json_path.read_bytes()
+    comics = orjson.loads(data) if orjson else json.loads(data)
 
     print(f"[*] Loaded {len(comics)} comics from {json_path}")
 
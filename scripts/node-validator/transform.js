@@ -418,6 +418,24 @@ function parseAttrs(str) {
   return attrs;
 }
 
+// Only a handful of tag names are ever looked up, once per item, so compile each
+// name's open/close patterns once instead of on every call (and every match).
+// findElements is synchronous and never re-enters itself, so sharing the global
+// openRe is safe as long as its lastIndex is reset per call.
+const ELEMENT_PATTERNS = new Map();
+
+function elementPatterns(localName) {
+  let patterns = ELEMENT_PATTERNS.get(localName);
+  if (!patterns) {
+    patterns = {
+      openRe: new RegExp('<(?:[\\w-]+:)?' + localName + '\\b([^>]*?)(\\/)?>', 'gi'),
+      closeRe: new RegExp('<\\/(?:[\\w-]+:)?' + localName + '\\s*>', 'i'),
+    };
+    ELEMENT_PATTERNS.set(localName, patterns);
+  }
+  return patterns;
+}
+
 /**
  * Finds all top-level occurrences of a tag (any namespace prefix) directly in `xml`.
  * Returns { attrs, content } per match — content is null for self-closing tags.
@@ -426,7 +444,8 @@ function parseAttrs(str) {
  */
 function findElements(xml, localName) {
   const results = [];
-  const openRe = new RegExp('<(?:[\\w-]+:)?' + localName + '\\b([^>]*?)(\\/)?>', 'gi');
+  const { openRe, closeRe } = elementPatterns(localName);
+  openRe.lastIndex = 0;
   let match;
   while ((match = openRe.exec(xml)) !== null) {
     const attrs = parseAttrs(match[1] || '');
@@ -434,7 +453,6 @@ function findElements(xml, localName) {
       results.push({ attrs, content: null });
       continue;
     }
-    const closeRe = new RegExp('<\\/(?:[\\w-]+:)?' + localName + '\\s*>', 'i');
     const rest = xml.slice(openRe.lastIndex);
     const closeMatch = rest.match(closeRe);
     if (closeMatch) {
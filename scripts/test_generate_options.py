@@ -0,0 +1,169 @@
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+import yaml
+
+_spec = importlib.util.spec_from_file_location(
+    "generate_options", Path(__file__).resolve().parent / "generate-options.py")
+generate_options = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generate_options)
+
+
+class TestWriteSettings(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "settings.yml"
+        self.path.write_text(
+            "strategy: polling\n"
+            "custom_fields:\n"
+            "- keyname: about\n"
+            "  name: About\n"
+            "id: 1\n",
+            encoding='utf-8')
+
+    def load(self):
+        return yaml.safe_load(self.path.read_text(encoding='utf-8'))
+
+    def test_multiline_value_is_fully_replaced(self):
+        multiline = [{'keyname': 'comics', 'name': 'line one\nline two', 'description': 'x\n\n    y'}]
+        normal = [{'keyname': 'comics', 'name': 'Comics'}]
+
+        generate_options.write_settings(self.path, multiline)
+        self.assertEqual(self.load()['custom_fields'], multiline)
+
+        generate_options.write_settings(self.path, normal)
+        settings = self.load()
+        self.assertEqual(settings, {'strategy': 'polling', 'custom_fields': normal, 'id': 1})
+        self.assertEqual(self.path.read_text(encoding='utf-8').count('keyname'), 1)
+
+
+class TestValidateFeedGroups(TestCase):
+    def validate(self, groups, drop_urls=()):
+        """Run validate_feed_groups against a stub validator; returns (split, validator calls)"""
+        calls = []
+
+        def fake_validator(feeds, timeout, concurrency):
+            calls.append(list(feeds))
+            return [SimpleNamespace(name=name, url=url, is_valid='bad' not in url, error_message=None)
+                    for name, url in feeds if url not in drop_urls]
+
+        with mock.patch.object(generate_options, 'run_feed_validator', fake_validator):
+            return generate_options.validate_feed_groups(groups), calls
+
+    def test_shared_url_is_validated_once_and_renamed(self):
+        split, calls = self.validate({
+            'regular': {'A': 'https://x/a', 'A again': 'https://x/a'},
+            'political': {'B': 'https://x/a', 'C': 'https://x/bad'},
+        })
+        self.assertEqual(calls, [[('A', 'https://x/a'), ('C', 'https://x/bad')]])
+        valid, invalid = split['regular']
+        self.assertEqual([(r.name, r.url) for r in valid], [('A', 'https://x/a'), ('A again', 'https://x/a')])
+        self.assertEqual(invalid, [])
+        valid, invalid = split['political']
+        self.assertEqual([r.name for r in valid], ['B'])
+        self.assertEqual([r.name for r in invalid], ['C'])
+
+    def test_malformed_url_is_not_fetched(self):
+        split, calls = self.validate({'extra': {'Good': 'https://x/good', 'Bad': 'not a url', 'Empty': ''}})
+        self.assertEqual(calls, [[('Good', 'https://x/good')]])
+        valid, invalid = split['extra']
+        self.assertEqual([r.name for r in valid], ['Good'])
+        self.assertEqual([(r.name, r.error_message) for r in invalid],
+                         [('Bad', 'Invalid feed URL'), ('Empty', 'Invalid feed URL')])
+
+    def test_missing_result_is_invalid(self):
+        split, _ = self.validate({'regular': {'A': 'https://x/a', 'B': 'https://x/b'}},
+                                 drop_urls={'https://x/b'})
+        valid, invalid = split['regular']
+        self.assertEqual([r.name for r in valid], ['A'])
+        self.assertEqual([(r.name, r.is_valid, r.error_message) for r in invalid],
+                         [('B', False, 'No validation result')])
+
+
+class FakeSession:
+    """Stands in for SESSION, answering with the queued status codes in order"""
+
+    def __init__(self, *status_codes, content=b'[1, 2]'):
+        self.status_codes = list(status_codes)
+        self.content = content
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        status_code = self.status_codes.pop(0)
+        return SimpleNamespace(status_code=status_code, content=self.content,
+                               headers={'ETag': '"v1"', 'Last-Modified': 'Thu, 01 Jan 2026 00:00:00 GMT'},
+                               raise_for_status=lambda: None)
+
+
+class TestGetComicsData(TestCase):
+    URL = 'https://comiccaster.xyz/comics_list.json'
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        key = hashlib.sha1(self.URL.encode('utf-8')).hexdigest()
+        self.body_path = self.cache_dir / f"{key}.json"
+        self.meta_path = self.cache_dir / f"{key}.meta.json"
+        for patcher in (mock.patch.object(generate_options, 'HTTP_CACHE_DIR', self.cache_dir),
+                        mock.patch.dict(os.environ, {'COMICS_CACHE_TTL': '3600'})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fetch(self, session):
+        with mock.patch.object(generate_options, 'SESSION', session):
+            return generate_options.get_comics_data(self.URL)
+
+    def write_cache(self, body: bytes, age: float = 0):
+        self.body_path.write_bytes(body)
+        self.meta_path.write_text(json.dumps({'etag': '"v1"', 'last_modified': None}), encoding='utf-8')
+        mtime = self.body_path.stat().st_mtime - age
+        os.utime(self.body_path, (mtime, mtime))
+
+    def test_miss_fetches_and_caches(self):
+        session = FakeSession(200)
+        self.assertEqual(self.fetch(session), [1, 2])
+        self.assertEqual(session.requests, [{}])
+        self.assertEqual(self.body_path.read_bytes(), b'[1, 2]')
+        self.assertEqual(self.fetch(FakeSession()), [1, 2])
+
+    def test_fresh_hit_skips_the_network(self):
+        self.write_cache(b'[3]')
+        session = FakeSession()
+        self.assertEqual(self.fetch(session), [3])
+        self.assertEqual(session.requests, [])
+
+    def test_stale_cache_is_revalidated(self):
+        self.write_cache(b'[3]', age=7200)
+        session = FakeSession(304)
+        self.assertEqual(self.fetch(session), [3])
+        self.assertEqual(session.requests, [{'If-None-Match': '"v1"'}])
+        self.assertEqual(self.fetch(FakeSession()), [3])  # the 304 refreshed the mtime
+
+    def test_corrupt_fresh_body_is_refetched(self):
+        self.write_cache(b'[1,')
+        session = FakeSession(200)
+        self.assertEqual(self.fetch(session), [1, 2])
+        self.assertEqual(session.requests, [{}])
+        self.assertEqual(self.body_path.read_bytes(), b'[1, 2]')
+
+    def test_corrupt_body_behind_304_is_refetched(self):
+        self.write_cache(b'[1,', age=7200)
+        session = FakeSession(304, 200)
+        self.assertEqual(self.fetch(session), [1, 2])
+        self.assertEqual(session.requests, [{'If-None-Match': '"v1"'}, {}])
+
+    def test_zero_ttl_always_fetches(self):
+        self.write_cache(b'[3]')
+        session = FakeSession(200)
+        with mock.patch.dict(os.environ, {'COMICS_CACHE_TTL': '0'}):
+            self.assertEqual(self.fetch(session), [1, 2])
+        self.assertEqual(session.requests, [{}])